@@ -12,9 +12,19 @@ an observation you wish to explain
 
 
 The abduce function will return all (minimal) sets of abducibles that, together with your KB, can entail the observation.
-from typing import List, Set, Tuple
-from itertools import product
 """
+import heapq
+from typing import List, Set, Tuple, Dict, Iterable, Iterator, Optional, Callable, TypeVar
+
+try:
+    import numpy as np
+    from scipy.sparse import csr_matrix
+except ImportError:  # fall back to the pure-Python reachability fixpoint
+    csr_matrix = None
+
+# KBs with at least this many clauses compute reachability with sparse matrix products
+_SPARSE_MIN_CLAUSES = 256
+
 # ————— Data structures —————
 
 class HornClause:
@@ -31,6 +41,412 @@ class HornClause:
 
 # ————— Abductive reasoning —————
 
+# Explanations are bitmasks over the abducibles: bit i set ⇔ the i-th abducible is assumed.
+# A goal's explanations form a sorted tuple of such masks (an "explanation list").
+Explanations = Tuple[int, ...]
+
+V = TypeVar("V")
+
+def _compile_kb(
+    kb: List[HornClause],
+    abducibles: Set[str]
+) -> Tuple[Dict[str, List[HornClause]], Set[str]]:
+    """
+    Index the clauses by head, and compute by a bottom-up fixpoint the atoms
+    that can be derived at all once every abducible is assumed. No explanation
+    exists for an atom outside `reachable`.
+    """
+    by_head: Dict[str, List[HornClause]] = {}
+    for clause in kb:
+        by_head.setdefault(clause.head, []).append(clause)
+
+    if csr_matrix is not None and len(kb) >= _SPARSE_MIN_CLAUSES:
+        return by_head, _reachable_sparse(kb, abducibles)
+
+    # each clause waits on its body atoms that are not reachable yet, and fires
+    # (making its head reachable) once the last of them is; no clause fires twice
+    waiting = [len(set(clause.body)) for clause in kb]
+    users: Dict[str, List[int]] = {}
+    for i, clause in enumerate(kb):
+        for b in set(clause.body):
+            users.setdefault(b, []).append(i)
+    reachable = set(abducibles) | {clause.head for clause in kb if not clause.body}
+    agenda = list(reachable)
+    while agenda:
+        for i in users.get(agenda.pop(), ()):
+            waiting[i] -= 1
+            if waiting[i] == 0 and kb[i].head not in reachable:
+                reachable.add(kb[i].head)
+                agenda.append(kb[i].head)
+    return by_head, reachable
+
+def _reachable_sparse(kb: List[HornClause], abducibles: Set[str]) -> Set[str]:
+    """
+    The reachability fixpoint of _compile_kb() as sparse matrix products.
+    body_mat[i, a] counts how often atom a occurs in the body of clause i, so
+    clause i fires once body_mat[i] · r equals its body size; each round marks
+    the heads of all fired clauses until no new head appears.
+    """
+    atoms = sorted(set(abducibles) | {c.head for c in kb} | {b for c in kb for b in c.body})
+    atom_id = {a: i for i, a in enumerate(atoms)}
+    rows = [i for i, clause in enumerate(kb) for _ in clause.body]
+    cols = [atom_id[b] for clause in kb for b in clause.body]
+    body_mat = csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                          shape=(len(kb), len(atoms)))
+    body_size = np.asarray(body_mat.sum(axis=1)).ravel()
+    head_ids = np.array([atom_id[c.head] for c in kb], dtype=np.intp)
+
+    r = np.zeros(len(atoms), dtype=np.int32)
+    r[[atom_id[a] for a in abducibles]] = 1
+    while True:
+        new_heads = head_ids[body_mat.dot(r) == body_size]
+        if r[new_heads].all():
+            break
+        r[new_heads] = 1
+    return {a for a in atoms if r[atom_id[a]]}
+
+def _minimize(explanations: Iterable[int]) -> List[int]:
+    """
+    Keep only the inclusion-minimal explanations (dropping duplicates too).
+    Sorting by popcount means every possible subset of `e` is kept or
+    discarded before `e` itself is examined, so a single sweep suffices.
+    """
+    kept: List[int] = []
+    for e in sorted(explanations, key=int.bit_count):
+        if all((k & ~e) != 0 for k in kept):
+            kept.append(e)
+    return kept
+
+def _cheapest_derivations(
+    kb: List[HornClause],
+    leaves: Dict[str, V],
+    combine: Callable[[V, V], V],
+    zero: V
+) -> Dict[str, V]:
+    """
+    The least value of a derivation of every derivable atom, where abducible `a`
+    is worth `leaves[a]` and a clause folds the values of its distinct body atoms
+    with `combine`, starting from `zero`. `combine` must be monotone and never
+    below its arguments (like max or +), so atoms can be settled cheapest first
+    as in Dijkstra's algorithm: a clause fires once, when its last body atom is
+    settled. Atoms missing from the result cannot be derived at all.
+    """
+    # clauses by body atom, with the number of body atoms still unsettled
+    waiting = [len(set(clause.body)) for clause in kb]
+    acc = [zero] * len(kb)
+    users: Dict[str, List[int]] = {}
+    for i, clause in enumerate(kb):
+        for b in set(clause.body):
+            users.setdefault(b, []).append(i)
+    heap = [(value, a) for a, value in leaves.items()]
+    heap += [(zero, clause.head) for clause in kb if not clause.body]
+    heapq.heapify(heap)
+
+    settled: Dict[str, V] = {}
+    while heap:
+        value, atom = heapq.heappop(heap)
+        if atom in settled:
+            continue
+        settled[atom] = value
+        for i in users.get(atom, ()):
+            acc[i] = combine(acc[i], value)
+            waiting[i] -= 1
+            if waiting[i] == 0 and kb[i].head not in settled:
+                heapq.heappush(heap, (acc[i], kb[i].head))
+    return settled
+
+class _CostBound:
+    """
+    Branch-and-bound state of one AbductionEngine.min_cost() query. `best` is
+    the cost of the cheapest explanation of the query goal known so far: it
+    starts at that of an explanation built greedily and drops whenever the
+    search completes a cheaper one. `lower` bounds the cost of every atom's
+    explanations from below: a clause costs at least its dearest body literal,
+    since explanations of different literals may share abducibles.
+    Explanation lists that lost members dearer than `best` are tabled in
+    `table` for this query only, never in the engine's memo.
+    """
+    __slots__ = ("bit_cost", "lower", "best", "table", "_totals", "_clause_bounds", "_ordered")
+
+    def __init__(self, engine: "AbductionEngine", goal: str, cost_map: Dict[str, float]):
+        inf = float('inf')
+        self.bit_cost = [(bit, cost_map.get(a, inf)) for a, bit in engine._atom_bit.items()]
+        self._totals: Dict[int, float] = {}
+        self.lower = _cheapest_derivations(
+            engine.kb, {a: cost_map.get(a, inf) for a in engine.abducibles}, max, 0.0)
+        # (sum of costs, union of bits): the sum overestimates shared abducibles, so
+        # the greedy explanation's own total is taken as the starting bound
+        greedy = _cheapest_derivations(
+            engine.kb, {a: (cost_map.get(a, inf), bit) for a, bit in engine._atom_bit.items()},
+            lambda x, y: (x[0] + y[0], x[1] | y[1]), (0.0, 0))
+        self.best = self.total(greedy[goal][1]) if goal in greedy else inf
+        self.table: Dict[str, Explanations] = {}
+        self._clause_bounds: Dict[int, float] = {}
+        self._ordered: Dict[str, List[HornClause]] = {}
+
+    def total(self, mask: int) -> float:
+        t = self._totals.get(mask)
+        if t is None:
+            t = self._totals[mask] = sum(c for bit, c in self.bit_cost if mask & bit)
+        return t
+
+    def clause_bound(self, clause: HornClause) -> float:
+        lower = self._clause_bounds.get(id(clause))
+        if lower is None:
+            lower = max((self.lower.get(b, float('inf')) for b in clause.body), default=0.0)
+            self._clause_bounds[id(clause)] = lower
+        return lower
+
+    def ordered(self, goal: str, clauses: List[HornClause]) -> List[HornClause]:
+        """`goal`'s clauses, cheapest bound first (sorted once per query)."""
+        if goal not in self._ordered:
+            self._ordered[goal] = sorted(clauses, key=self.clause_bound)
+        return self._ordered[goal]
+
+class _Frame:
+    """
+    A goal being solved by AbductionEngine._explain: the clauses still to try
+    for it, and the clause body currently being folded (its next literal and
+    the minimal partial unions of the literals before it).
+    """
+    __slots__ = ("goal", "depth", "low", "clauses", "explanations", "body", "pos", "partial", "pruned")
+
+    def __init__(self, goal: str, depth: int, clauses: Iterator[HornClause]):
+        self.goal = goal
+        self.depth = depth
+        self.low = depth
+        self.clauses = clauses
+        # a set, so the many equal unions produced are deduplicated on insert
+        self.explanations: Set[int] = set()
+        self.body: Optional[List[str]] = None
+        self.pos = 0
+        self.partial: Explanations = ()
+        # set once a cost bound dropped explanations of this goal or of a subgoal
+        self.pruned = False
+
+class AbductionEngine:
+    """
+    Abductive reasoner for a fixed set of abducibles over a KB that may only grow.
+    The compiled KB, the abducible bit positions and the table of explanations per
+    goal are kept between queries, so asking about other goals or with other cost
+    maps reuses everything computed so far.
+    """
+    def __init__(self, kb: List[HornClause], abducibles: Set[str]):
+        self.kb = list(kb)
+        self.abducibles = set(abducibles)
+        self._atom_bit = {a: 1 << i for i, a in enumerate(sorted(self.abducibles))}
+        self._by_head, self._reachable = _compile_kb(self.kb, self.abducibles)
+        # reverse dependencies: body atom → heads of the clauses it occurs in
+        self._users: Dict[str, Set[str]] = {}
+        for clause in self.kb:
+            self._add_users(clause)
+        self._memo: Dict[str, Explanations] = {}
+        # Hash-consing: equal explanation lists share one tuple, so the same
+        # sub-explanations reached from many parents are one object, and joining
+        # two of them can be cached on their identities.
+        self._pool: Dict[Explanations, Explanations] = {}
+        self._join_cache: Dict[Tuple[int, int], Explanations] = {}
+
+    def _add_users(self, clause: HornClause):
+        for b in clause.body:
+            self._users.setdefault(b, set()).add(clause.head)
+
+    def _intern(self, explanations: Iterable[int]) -> Explanations:
+        key = tuple(sorted(explanations))
+        return self._pool.setdefault(key, key)
+
+    def _join(self, left: Explanations, right: Explanations) -> Explanations:
+        """Minimal pairwise unions of two interned explanation lists (cached)."""
+        key = (id(left), id(right))
+        joined = self._join_cache.get(key)
+        if joined is None:
+            joined = self._intern(_minimize({p | e for p in left for e in right}))
+            self._join_cache[key] = joined
+        return joined
+
+    def decode(self, mask: int) -> Set[str]:
+        """Turn an explanation bitmask back into its set of abducibles."""
+        return {a for a, bit in self._atom_bit.items() if mask & bit}
+
+    def explain(self, goal: str) -> List[int]:
+        """Return the (inclusion-)minimal explanations of `goal` as bitmasks (see decode)."""
+        minimal, _ = self._explain(goal, {})
+        return list(minimal)
+
+    def min_cost(self, goal: str, cost_map: Dict[str, float]) -> List[int]:
+        """
+        Return the explanations of `goal` whose total cost is the lowest.
+        A tabled goal just has its explanations scored; otherwise this is a
+        branch-and-bound search (see _CostBound) that drops every partial
+        explanation dearer than the cheapest one known while folding clause
+        bodies, and tries clauses in order of their lower bound.
+        """
+        if goal in self._memo:
+            scored = [(sum(cost_map.get(a, float('inf')) for a in self.decode(mask)), mask)
+                      for mask in self._memo[goal]]
+        else:
+            bound = _CostBound(self, goal, cost_map)
+            minimal, _ = self._explain(goal, {}, bound)
+            scored = [(bound.total(mask), mask) for mask in minimal]
+        if not scored:
+            return []
+        min_cost = min(total for total, _ in scored)
+        return [mask for total, mask in scored if total == min_cost]
+
+    def assert_clause(self, clause: HornClause):
+        """
+        Add a clause to the KB, dropping only the tabled goals whose explanations
+        can change: its head and everything that (transitively) depends on it.
+        """
+        self.kb.append(clause)
+        self._by_head.setdefault(clause.head, []).append(clause)
+        self._add_users(clause)
+        # the new clause can only make atoms reachable by firing itself: mark its head,
+        # then forward along self._users every head that now has a fully reachable clause
+        if clause.head not in self._reachable and all(b in self._reachable for b in clause.body):
+            self._reachable.add(clause.head)
+            agenda = [clause.head]
+            while agenda:
+                for head in self._users.get(agenda.pop(), ()):
+                    if head not in self._reachable and any(
+                            all(b in self._reachable for b in c.body) for c in self._by_head[head]):
+                        self._reachable.add(head)
+                        agenda.append(head)
+
+        stale = {clause.head}
+        stack = [clause.head]
+        while stack:
+            for head in self._users.get(stack.pop(), ()):
+                if head not in stale:
+                    stale.add(head)
+                    stack.append(head)
+        for goal in stale:
+            self._memo.pop(goal, None)
+
+    def _within(self, explanations: Explanations, bound: _CostBound, frame: _Frame) -> Explanations:
+        """Drop the explanations dearer than `bound.best`, marking `frame` as pruned if any."""
+        kept = [mask for mask in explanations if bound.total(mask) <= bound.best]
+        if len(kept) == len(explanations):
+            return explanations
+        frame.pruned = True
+        return self._intern(kept)
+
+    def _open(
+        self,
+        goal: str,
+        in_progress: Dict[str, int],
+        stack: List[_Frame],
+        bound: Optional[_CostBound] = None
+    ) -> Optional[Tuple[Explanations, int]]:
+        """
+        Start solving `goal`. Returns (explanations, low) right away if the
+        answer is already known (unreachable, cut, tabled, or too dear for
+        `bound`); otherwise pushes a new frame for it onto `stack` and returns None.
+        """
+        depth = len(in_progress)
+        if goal not in self._reachable:
+            return (), depth
+        # avoid infinite loops on recursive rules
+        if goal in in_progress:
+            return (), in_progress[goal]
+        if goal in self._memo:
+            return self._memo[goal], depth
+        if bound is not None and (goal in bound.table or bound.lower.get(goal, float('inf')) > bound.best):
+            # either way the answer lacks explanations, so the caller's does too
+            if stack:
+                stack[-1].pruned = True
+            return bound.table.get(goal, ()), depth
+        in_progress[goal] = depth
+        clauses = self._by_head.get(goal, [])
+        if bound is not None:
+            # cheapest bound first, so a cheap explanation tightens the bound early
+            clauses = bound.ordered(goal, clauses)
+        frame = _Frame(goal, depth, iter(clauses))
+        # 1) Direct assumption
+        if goal in self._atom_bit:
+            frame.explanations.add(self._atom_bit[goal])
+            if bound is not None and not stack:
+                bound.best = min(bound.best, bound.total(self._atom_bit[goal]))
+        stack.append(frame)
+        return None
+
+    def _explain(
+        self,
+        goal: str,
+        in_progress: Dict[str, int],
+        bound: Optional[_CostBound] = None
+    ) -> Tuple[Explanations, int]:
+        """
+        Tabled worker behind explain() and min_cost(), driven by an explicit stack
+        of frames instead of recursion, so deep KBs cannot hit Python's recursion limit.
+        `in_progress` maps each goal on the current derivation path to its depth.
+        Returns the minimal explanations of `goal` together with the smallest depth
+        of an in-progress goal the search had to cut at. A result that was cut at a
+        goal above this one depends on the path, so only the others are tabled.
+        With a `bound`, explanations dearer than `bound.best` are dropped as they are
+        folded (costs only grow along a fold); every explanation no dearer than the
+        final `bound.best` is still returned.
+        """
+        stack: List[_Frame] = []
+        answer = self._open(goal, in_progress, stack, bound)
+        while stack:
+            frame = stack[-1]
+            if answer is not None:
+                # the subgoal this frame was waiting on is done: fold its
+                # explanations into the clause's minimal partial unions
+                exs, sub_low = answer
+                answer = None
+                frame.low = min(frame.low, sub_low)
+                if bound is None:
+                    frame.partial = self._join(frame.partial, exs)
+                else:
+                    exs = self._within(exs, bound, frame)
+                    frame.partial = self._within(self._join(frame.partial, exs), bound, frame)
+                frame.pos += 1
+                # a body literal without explanations rules the whole clause out
+                if not frame.partial:
+                    frame.body = None
+
+            if frame.body is not None:
+                if frame.pos < len(frame.body):
+                    # 2) wait on the next body literal
+                    answer = self._open(frame.body[frame.pos], in_progress, stack, bound)
+                    continue
+                frame.explanations.update(frame.partial)
+                frame.body = None
+                # a complete explanation of the query goal tightens the bound right away
+                if bound is not None and len(stack) == 1 and frame.partial:
+                    bound.best = min(bound.best, min(map(bound.total, frame.partial)))
+
+            # next clause for this goal
+            clause = next(frame.clauses, None)
+            if clause is not None:
+                # a body literal that can never be derived rules the clause out up front
+                if not all(b in self._reachable for b in clause.body):
+                    continue
+                if bound is not None and bound.clause_bound(clause) > bound.best:
+                    frame.pruned = True
+                    continue
+                frame.body, frame.pos, frame.partial = clause.body, 0, self._intern((0,))
+                continue
+
+            # 3) all clauses tried: prune non‐minimal (by set‐inclusion) and complete the goal
+            stack.pop()
+            del in_progress[frame.goal]
+            minimal = self._intern(_minimize(frame.explanations))
+            if bound is not None:
+                minimal = self._within(minimal, bound, frame)
+                if frame.pruned and stack:
+                    stack[-1].pruned = True
+            if frame.low >= frame.depth:
+                # results missing explanations dearer than the bound only hold for this query
+                if frame.pruned:
+                    bound.table[frame.goal] = minimal
+                else:
+                    self._memo[frame.goal] = minimal
+            answer = (minimal, frame.low)
+        return answer
+
 def abduce(
     goal: str,
     kb: List[HornClause],
@@ -38,41 +454,26 @@ def abduce(
     seen: Set[str]=None
 ) -> List[Set[str]]:
     """
-    Return a list of sets of abducibles that explain `goal`.
-    Each explanation is a set of atoms ⊆ abducibles.
+    Return all (inclusion-)minimal sets of abducibles that explain `goal`.
+    Atoms in `seen` are treated as already on the derivation path: they are
+    never expanded, so no explanation may rely on them.
+    For repeated queries against one KB, keep an AbductionEngine instead.
     """
-    if seen is None:
-        seen = set()
-    # avoid infinite loops on recursive rules
-    if goal in seen:
-        return []
-    seen = seen | {goal}
-
-    # 1) If goal itself is abducible, one explanation is to assume it directly:
-    explanations: List[Set[str]] = []
-    if goal in abducibles:
-        explanations.append({goal})
-
-    # 2) Otherwise, look for clauses that can derive goal
-    for clause in kb:
-        if clause.head == goal:
-            # for each body literal, get its explanations
-            sub_expls = [ abduce(b, kb, abducibles, seen) for b in clause.body ]
-            # if any body literal has no explanation, this clause won't fire
-            if any(len(exs) == 0 for exs in sub_expls):
-                continue
-            # take one choice of explanation per body literal (cartesian product)
-            for combo in product(*sub_expls):
-                # combo is a tuple of sets; union them
-                merged = set().union(*combo)
-                explanations.append(merged)
-
-    # 3) remove non‐minimal explanations (prune supersets)
-    minimal: List[Set[str]] = []
-    for e in explanations:
-        if not any((e2 < e) for e2 in explanations):
-            minimal.append(e)
-    return minimal
+    engine = AbductionEngine(kb, abducibles)
+    minimal, _ = engine._explain(goal, dict.fromkeys(seen or (), 0))
+    return [engine.decode(mask) for mask in minimal]
+
+def abduce_many(
+    goals: List[str],
+    kb: List[HornClause],
+    abducibles: Set[str]
+) -> Dict[str, List[Set[str]]]:
+    """
+    abduce() for several goals against the same KB. The KB is compiled once and
+    the subgoal tables filled for one goal are reused by the next.
+    """
+    engine = AbductionEngine(kb, abducibles)
+    return {goal: [engine.decode(mask) for mask in engine.explain(goal)] for goal in goals}
 
 # ————— Example usage —————
 if __name__ == "__main__":
@@ -107,150 +508,40 @@ Direct abduction
 
 Backward‐chaining
  For each clause with head = goal, recursively abduct each literal in the body.
+ The recursion is driven by an explicit stack of goal frames rather than Python calls, so deep KBs cannot hit the recursion limit.
 
 
 If any body literal has no explanation, that clause can’t derive the goal.
 
 
-Otherwise, take the Cartesian product of explanations for each sub‐goal and union them into candidate explanations.
+Otherwise, combine one explanation per sub‐goal by folding the body in one literal at a time:
+ each partial union is ORed with every explanation of the next literal, and non‐minimal partials are pruned before moving on,
+ so the full Cartesian product is never materialized.
 
 
-Minimality pruning
- Once all candidates are collected, we discard any explanation that strictly contains another: only minimal sets of assumptions remain.
+Tabling
+ Each sub‐goal’s explanations are stored in a memo table the first time they are computed, so a sub‐goal shared by many clauses is solved once per abduce call.
+ Goals currently being expanded are cut to avoid loops; a result that was cut at one of its ancestors depends on the path and is not tabled.
 
 
-This simple abductive solver works for propositional Horn theories. You can extend it by adding weights or preferences over abducibles, or by integrating a cost‐minimization step to pick the “best” explanation.
-========================================================================
+Reuse across queries
+ abduce builds a fresh AbductionEngine per call. To ask many questions of the same KB, keep one engine: its compiled KB and memo table
+ survive between explain/min_cost calls, and assert_clause only drops the tabled goals that depend on the new clause’s head.
 
-Here’s an extension of the Horn‐clause abducer that lets you assign a numeric cost to each abducible and then returns only those explanations whose total cost is minimal.
 
-from typing import List, Set, Tuple, Dict
-from itertools import product
-"""
-# ————— Data structures —————
+Cost bounds
+ min_cost runs the same frame loop with a branch‐and‐bound: partial explanations dearer than the cheapest explanation known so far are dropped as they are folded.
+ Goals whose explanation lists lost members that way are tabled for that query only, so the shared memo table always holds complete lists.
 
-class HornClause:
-    """A definite clause of the form head :- body1, body2, ..."""
-    def __init__(self, head: str, body: List[str]):
-        self.head = head
-        self.body = body
-
-    def __repr__(self):
-        if self.body:
-            return f"{self.head} :- " + ", ".join(self.body)
-        else:
-            return f"{self.head}."
-
-# ————— Abductive reasoning with minimality by inclusion —————
-
-def abduce(
-    goal: str,
-    kb: List[HornClause],
-    abducibles: Set[str],
-    seen: Set[str]=None
-) -> List[Set[str]]:
-    """
-    Return all (inclusion-)minimal sets of abducibles that explain `goal`.
-    """
-    if seen is None:
-        seen = set()
-    if goal in seen:
-        return []
-    seen = seen | {goal}
-
-    explanations: List[Set[str]] = []
-    # 1) Direct assumption
-    if goal in abducibles:
-        explanations.append({goal})
-
-    # 2) Derivation via clauses
-    for clause in kb:
-        if clause.head == goal:
-            # recursively get explanations for each body literal
-            sub_expls = [abduce(b, kb, abducibles, seen) for b in clause.body]
-            # if any body literal fails to explain, skip this clause
-            if any(len(exs) == 0 for exs in sub_expls):
-                continue
-            # combine one explanation per literal
-            for combo in product(*sub_expls):
-                merged = set().union(*combo)
-                explanations.append(merged)
-
-    # 3) Prune non‐minimal (by set‐inclusion)
-    minimal: List[Set[str]] = []
-    for e in explanations:
-        if not any((other < e) for other in explanations):
-            minimal.append(e)
-    return minimal
-
-# ————— Cost‐minimizing wrapper —————
-
-def abduce_min_cost(
-    goal: str,
-    kb: List[HornClause],
-    abducibles: Set[str],
-    cost: Dict[str, float]
-) -> List[Set[str]]:
-    """
-    Return those explanations whose total cost is the lowest.
-    `cost` maps each abducible atom → nonnegative numeric cost.
-    """
-    all_expls = abduce(goal, kb, abducibles)
-    # annotate with total cost
-    scored = []
-    for expl in all_expls:
-        total = sum(cost.get(a, float('inf')) for a in expl)
-        scored.append((total, expl))
-    if not scored:
-        return []
-    # find minimal total cost
-    min_cost = min(score for score, _ in scored)
-    # return all explanations achieving that cost
-    return [expl for score, expl in scored if score == min_cost]
-
-# ————— Example usage —————
-if __name__ == "__main__":
-    # Knowledge base:
-    #   r :- p, q.
-    #   r :- s.
-    #   p :- t.
-    #   q.
-    kb = [
-        HornClause("r", ["p", "q"]),
-        HornClause("r", ["s"]),
-        HornClause("p", ["t"]),
-        HornClause("q", []),
-    ]
-
-    abducibles = {"s", "t"}
-    # assign costs: assuming s is expensive to hypothesize
-    cost_map = {"s": 5.0, "t": 1.0}
-
-    best_explanations = abduce_min_cost("r", kb, abducibles, cost_map)
-    print("Cheapest explanations for r:")
-    for e in best_explanations:
-        total = sum(cost_map[a] for a in e)
-        print(f"  {e}  (cost = {total})")
-    # Output:
-    #   {'t'}  (cost = 1.0)
-"""
-What changed?
-Cost map
- You provide cost: Dict[str, float] mapping each abducible to its numeric “penalty.”
-
-
-Wrapper function
-
-
-abduce_min_cost first calls the original abduce to get all inclusion-minimal explanations.
-
-
-It then computes each explanation’s total cost by summing its abducibles’ costs.
 
+Minimality pruning
+ Once all candidates are collected, we discard any explanation that contains another: only minimal sets of assumptions remain.
+ Explanations are bitmasks over the abducibles, so after sorting by popcount a single sweep with (kept & ~e) == 0 subset tests does the pruning.
 
-Finally, it filters out only those explanations whose total cost equals the global minimum.
 
+This simple abductive solver works for propositional Horn theories. You can extend it by adding weights or preferences over abducibles, or by integrating a cost‐minimization step to pick the “best” explanation.
+========================================================================
 
-Result
- You still get logically sound (minimal) explanations, but now you also ensure they’re the least “expensive” under whatever cost model makes sense for your domain.
+An extension of this abducer that lets you assign a numeric cost to each abducible, and returns only the explanations
+whose total cost is minimal, lives in PropInductionwCostMin.py; it builds on HornClause and AbductionEngine from this module.
 """
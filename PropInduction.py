@@ -5,6 +5,8 @@
 import math
 from typing import List, Tuple, Set
 
+import numpy as np
+
 # ————— Type aliases —————
 # A ground fact or example: predicate applied to a constant
 Example = Tuple[str, str]        # e.g. ("Fly", "tweety")
@@ -21,10 +23,47 @@ def foil_gain(p: int, n: int, p1: int, n1: int) -> float:
       n1 = # negatives covered after adding this literal
     FOIL gain = p1 * ( log2(p1/(p1+n1)) – log2(p/(p+n)) )
     """
-    if p == 0 or (p1 + n1) == 0:
+    if p == 0 or p1 == 0:
         return 0.0
     return p1 * (math.log2(p1 / (p1 + n1)) - math.log2(p / (p + n)))
 
+def foil_gains(p: int, n: int, p1: np.ndarray, n1: np.ndarray) -> np.ndarray:
+    """foil_gain for a whole vector of candidate literals at once."""
+    if p == 0:
+        return np.zeros(len(p1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gains = p1 * (np.log2(p1 / (p1 + n1)) - math.log2(p / (p + n)))
+    return np.where(p1 == 0, 0.0, gains)
+
+# ————— Example bitmaps —————
+# Coverage is kept as structure-of-arrays bitmaps over example indices:
+# bit i of word i // 64 is set iff example i is covered.
+
+def pack_bits(flags: np.ndarray) -> np.ndarray:
+    """Pack a boolean array of shape (..., n) into uint64 words of shape (..., ceil(n / 64))."""
+    n = flags.shape[-1]
+    padded = np.zeros(flags.shape[:-1] + (-(-n // 64) * 64,), dtype=np.bool_)
+    padded[..., :n] = flags
+    return np.packbits(padded, axis=-1, bitorder="little").view("<u8")
+
+def first_bit(words: np.ndarray) -> int:
+    """Index of the lowest set bit in a non-empty bitmap."""
+    w = int(np.flatnonzero(words)[0])
+    word = int(words[w])
+    return w * 64 + (word & -word).bit_length() - 1
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Population count of every uint64 word (np.bitwise_count on NumPy ≥ 2.0, SWAR otherwise)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    x = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    x = x + (x >> np.uint64(8))
+    x = x + (x >> np.uint64(16))
+    x = x + (x >> np.uint64(32))
+    return x & np.uint64(0x7F)
+
 # ————— The learning loop —————
 def learn_rules(
     pos: List[Example],
@@ -37,57 +76,52 @@ def learn_rules(
     Returns a list of rules: (head_predicate, variable, [body_literals]).
     """
     rules: List[Tuple[str, str, List[Literal]]] = []
-    pos_examples = pos[:]     # remaining positives to cover
-    neg_examples = neg[:]     # all negatives
 
-    while pos_examples:
+    # Per-predicate coverage bitmaps: bit i of pred_pos[k] is set iff preds[k](pos[i]'s constant) holds
+    preds = sorted(predicates)
+    pred_pos = pack_bits(np.array([[(pred, e[1]) in background for e in pos] for pred in preds],
+                                  dtype=np.bool_).reshape(len(preds), len(pos)))
+    pred_neg = pack_bits(np.array([[(pred, e[1]) in background for e in neg] for pred in preds],
+                                  dtype=np.bool_).reshape(len(preds), len(neg)))
+
+    remaining = pack_bits(np.ones(len(pos), dtype=np.bool_))   # positives still to cover
+    while remaining.any():
         # Assume all examples share the same head predicate and variable X
-        head_pred = pos_examples[0][0]
+        head_pred = pos[first_bit(remaining)][0]
         var = "X"
         body: List[Literal] = []
+        used = np.zeros(len(preds), dtype=np.bool_)
 
-        # Initialize the set of positives/negatives covered by the (empty) rule body
-        pos_cover = [e for e in pos_examples if e[0] == head_pred]
-        neg_cover = [e for e in neg_examples if e[0] == head_pred]
+        # Initialize the positives/negatives covered by the (empty) rule body
+        pos_cover = remaining & pack_bits(np.array([e[0] == head_pred for e in pos], dtype=np.bool_))
+        neg_cover = pack_bits(np.array([e[0] == head_pred for e in neg], dtype=np.bool_))
 
         # Repeatedly add the literal with highest FOIL gain until no negatives are covered
-        while neg_cover:
-            best_gain = 0.0
-            best_literal = None
-            best_pos_cover = []
-            best_neg_cover = []
-
-            p, n = len(pos_cover), len(neg_cover)
-            # Generate candidate literals: each predicate not yet in the body
-            for pred in predicates - {lit[0] for lit in body}:
-                # See which examples would still be covered if we added pred(X)
-                new_pos = [e for e in pos_cover if (pred, e[1]) in background]
-                new_neg = [e for e in neg_cover if (pred, e[1]) in background]
-                gain = foil_gain(p, n, len(new_pos), len(new_neg))
-                if gain > best_gain:
-                    best_gain = gain
-                    best_literal = (pred, var)
-                    best_pos_cover = new_pos
-                    best_neg_cover = new_neg
+        while neg_cover.any():
+            # Score every predicate in one pass: AND each predicate's bitmap with the
+            # current cover and popcount the rows
+            p, n = int(popcount(pos_cover).sum()), int(popcount(neg_cover).sum())
+            p1 = popcount(pred_pos & pos_cover).sum(axis=1)
+            n1 = popcount(pred_neg & neg_cover).sum(axis=1)
+            gains = foil_gains(p, n, p1, n1)
+            gains[used] = 0.0
 
             # Stop if no literal improves things
-            if best_literal is None:
+            best = int(np.argmax(gains)) if len(gains) else -1
+            if best < 0 or gains[best] <= 0.0:
                 break
 
             # Otherwise, add it and narrow down covered sets
-            body.append(best_literal)
-            pos_cover = best_pos_cover
-            neg_cover = best_neg_cover
+            body.append((preds[best], var))
+            used[best] = True
+            pos_cover &= pred_pos[best]
+            neg_cover &= pred_neg[best]
 
         # Record the learned rule
         rules.append((head_pred, var, body))
 
         # Remove all positives now covered by this rule
-        covered = [
-            e for e in pos_examples
-            if e[0] == head_pred and all((pred, e[1]) in background for pred, _ in body)
-        ]
-        pos_examples = [e for e in pos_examples if e not in covered]
+        remaining &= ~pos_cover
 
     return rules
 
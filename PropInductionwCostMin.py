@@ -1,89 +1,45 @@
 """
 an extension of the Horn‐clause abducer that lets you assign a numeric cost to each abducible and then returns only those explanations whose total cost is minimal.
 """
-from typing import List, Set, Tuple, Dict
-from itertools import product
+from typing import List, Set, Dict
 
-# ————— Data structures —————
+# The Horn-clause abducer this extends: data structures, compiled KB and tabled engine
+from PropHornClauseAbduction import HornClause, AbductionEngine, abduce, abduce_many
 
-class HornClause:
-    """A definite clause of the form head :- body1, body2, ..."""
-    def __init__(self, head: str, body: List[str]):
-        self.head = head
-        self.body = body
+# abduce and abduce_many are re-exported for callers of this module
+__all__ = ["HornClause", "AbductionEngine", "abduce", "abduce_many",
+           "abduce_min_cost", "abduce_min_cost_many"]
 
-    def __repr__(self):
-        if self.body:
-            return f"{self.head} :- " + ", ".join(self.body)
-        else:
-            return f"{self.head}."
-
-# ————— Abductive reasoning with minimality by inclusion —————
+# ————— Cost‐minimizing wrapper —————
 
-def abduce(
+def abduce_min_cost(
     goal: str,
     kb: List[HornClause],
     abducibles: Set[str],
-    seen: Set[str]=None
+    cost: Dict[str, float]
 ) -> List[Set[str]]:
     """
-    Return all (inclusion-)minimal sets of abducibles that explain `goal`.
+    Return those explanations whose total cost is the lowest.
+    `cost` maps each abducible atom → nonnegative numeric cost.
+    For repeated queries against one KB, keep an AbductionEngine and call its
+    min_cost() instead.
     """
-    if seen is None:
-        seen = set()
-    if goal in seen:
-        return []
-    seen = seen | {goal}
-
-    explanations: List[Set[str]] = []
-    # 1) Direct assumption
-    if goal in abducibles:
-        explanations.append({goal})
-
-    # 2) Derivation via clauses
-    for clause in kb:
-        if clause.head == goal:
-            # recursively get explanations for each body literal
-            sub_expls = [abduce(b, kb, abducibles, seen) for b in clause.body]
-            # if any body literal fails to explain, skip this clause
-            if any(len(exs) == 0 for exs in sub_expls):
-                continue
-            # combine one explanation per literal
-            for combo in product(*sub_expls):
-                merged = set().union(*combo)
-                explanations.append(merged)
+    engine = AbductionEngine(kb, abducibles)
+    return [engine.decode(mask) for mask in engine.min_cost(goal, cost)]
 
-    # 3) Prune non‐minimal (by set‐inclusion)
-    minimal: List[Set[str]] = []
-    for e in explanations:
-        if not any((other < e) for other in explanations):
-            minimal.append(e)
-    return minimal
-
-# ————— Cost‐minimizing wrapper —————
-
-def abduce_min_cost(
-    goal: str,
+def abduce_min_cost_many(
+    goals: List[str],
     kb: List[HornClause],
     abducibles: Set[str],
     cost: Dict[str, float]
-) -> List[Set[str]]:
+) -> Dict[str, List[Set[str]]]:
     """
-    Return those explanations whose total cost is the lowest.
-    `cost` maps each abducible atom → nonnegative numeric cost.
+    abduce_min_cost() for several goals (e.g. a set of observations to diagnose).
+    The goals share one AbductionEngine, so the KB is compiled once and subgoal
+    tables are shared; each goal then runs the same min_cost() search as above.
     """
-    all_expls = abduce(goal, kb, abducibles)
-    # annotate with total cost
-    scored = []
-    for expl in all_expls:
-        total = sum(cost.get(a, float('inf')) for a in expl)
-        scored.append((total, expl))
-    if not scored:
-        return []
-    # find minimal total cost
-    min_cost = min(score for score, _ in scored)
-    # return all explanations achieving that cost
-    return [expl for score, expl in scored if score == min_cost]
+    engine = AbductionEngine(kb, abducibles)
+    return {goal: [engine.decode(mask) for mask in engine.min_cost(goal, cost)] for goal in goals}
 
 # ————— Example usage —————
 if __name__ == "__main__":
@@ -119,11 +75,12 @@ You provide cost: Dict[str, float] mapping each abducible to its numeric “pena
 
 Wrapper function
 
-abduce_min_cost first calls the original abduce to get all inclusion-minimal explanations.
+abduce_min_cost hands the goal and cost map to AbductionEngine.min_cost, the same cost search abduce_min_cost_many uses.
 
-It then computes each explanation’s total cost by summing its abducibles’ costs.
+That search is a branch‐and‐bound version of abduce that tracks the cheapest explanation found so far, starting from one built greedily.
+A forward pass over the KB gives each atom a lower bound on its explanation cost; clauses are tried cheapest bound first, and any partial explanation already dearer than the best one is dropped while clause bodies are folded, at every sub‐goal and not just the observation.
 
-Finally, it filters out only those explanations whose total cost equals the global minimum.
+Finally, it keeps only those inclusion‐minimal explanations whose total cost equals the global minimum.
 
 Result
 You still get logically sound (minimal) explanations, but now you also ensure they’re the least “expensive” under whatever cost model makes sense for your domain.